@@ -3,19 +3,30 @@ app.py — Simple To-Do List Application (Flask + SQLAlchemy)
 
 Features:
 - REST API for tasks (CRUD)
+- Bulk task creation in a single batched INSERT
 - Status filtering (all | active | completed)
 - Bulk delete by status
+- Active/completed counts, cached in Redis when configured
 - Health endpoint for liveness and DB checks
 - SQLite fallback for local/dev environments if DB is not configured
 
 Environment Variables:
 - DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD (for PostgreSQL)
+- DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_TIMEOUT
+  (optional; connection pool tuning, defaults 10 / 20 / 1800s / 5s)
+- REDIS_URL (optional; caches task counts for /api/tasks/stats)
+- STATS_CACHE_TTL (optional; seconds before cached counts are re-read, default 300)
+- REDIS_TIMEOUT (optional; Redis connect/read timeout in seconds, default 0.25)
 - PORT (optional; defaults to 5000)
+- FLASK_ENV (optional; "development" enables debug mode for `python app.py`)
 
 Usage:
     # Local SQLite (no env variables)
     python app.py
 
+    # Production (gevent workers, see wsgi.py)
+    gunicorn -k gevent --worker-connections 1000 -w $(nproc) wsgi:app
+
     # With PostgreSQL (RDS)
     export DB_HOST=...
     export DB_USER=...
@@ -24,11 +35,22 @@ Usage:
 """
 
 import os
+import functools
+import hashlib
+import time
+import uuid
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, text
-from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session
+import orjson
+from flask import Flask, render_template, request, jsonify, url_for
+from flask.globals import app_ctx
+from sqlalchemy import (
+    case, create_engine, event, func, Column, Index, Integer, String, Boolean, DateTime,
+    delete, insert, select, text, tuple_, update,
+)
+from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session, raiseload
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import now
 
 # Optional: auto-load .env file for local development
 try:
@@ -42,6 +64,10 @@ from config import SQLALCHEMY_DATABASE_URI  # noqa: E402
 
 # Allow DATABASE_URL override (useful for Heroku-style environments)
 DATABASE_URI = os.getenv("DATABASE_URL", SQLALCHEMY_DATABASE_URI)
+# Driverless Postgres URLs would default to psycopg2; use psycopg 3 instead
+for _prefix in ("postgres://", "postgresql://"):
+    if DATABASE_URI.startswith(_prefix):
+        DATABASE_URI = "postgresql+psycopg://" + DATABASE_URI[len(_prefix):]
 
 # -----------------------------------------------------------------------------
 # Database setup
@@ -51,14 +77,47 @@ engine = create_engine(
     DATABASE_URI,
     future=True,
     pool_pre_ping=True,   # validates connections before using
-    pool_recycle=300,     # refreshes connections periodically
+    pool_size=int(os.getenv("DB_POOL_SIZE", "10")),        # persistent connections per worker
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),  # extra connections under burst load
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),  # refreshes connections periodically
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "5")),   # fail fast instead of stalling clients
 )
 
-# Thread-local scoped session registry
+# Read-only endpoints use Core connections on this engine: no Session, and no
+# BEGIN/COMMIT round trips around single SELECTs
+_readonly_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+def _app_ctx_id():
+    """
+    Scope key for SessionLocal: the current Flask app context.
+
+    Unlike the default thread-local scope this stays per-request when several
+    gevent greenlets share one OS thread.
+    """
+    return id(app_ctx._get_current_object())
+
+
+# Request-scoped session registry (removed on app context teardown)
+# (expire_on_commit=False: handlers serialize after commit without re-SELECTing)
 SessionLocal = scoped_session(
-    sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False),
+    scopefunc=_app_ctx_id,
 )
 
+# Optional Redis for O(1) task counts; without REDIS_URL counts come from the DB
+REDIS_URL = os.getenv("REDIS_URL")
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "300"))
+# Short socket timeouts: writes call Redis inline, so a hung server must not stall them
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "0.25"))
+if REDIS_URL:
+    import redis
+    redis_client = redis.from_url(
+        REDIS_URL, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT
+    )
+else:
+    redis_client = None
+
 # -----------------------------------------------------------------------------
 # Flask app initialization
 # -----------------------------------------------------------------------------
@@ -66,6 +125,54 @@ app = Flask(__name__)
 app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
 
 
+@app.teardown_appcontext
+def _remove_session(exc):
+    """
+    Drop the request's session from the registry so entries never outlive
+    their app context (context ids can be reused).
+    """
+    SessionLocal.remove()
+
+
+def with_session(fn):
+    """
+    Pass a request-scoped session as the handler's first argument and
+    release it from the registry when the handler returns.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        db = SessionLocal()
+        try:
+            return fn(db, *args, **kwargs)
+        finally:
+            SessionLocal.remove()
+    return wrapper
+
+
+def _json(payload, status=200):
+    """
+    Build a JSON response with orjson.
+
+    Faster than jsonify for large lists; datetimes are serialized natively
+    (naive values are treated as UTC).
+    """
+    return app.response_class(
+        orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC),
+        status=status,
+        mimetype="application/json",
+    )
+
+
+@compiles(now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    """
+    SQLite's CURRENT_TIMESTAMP has second resolution and a different text
+    format than SQLAlchemy's DateTime binds, which breaks ordering and keyset
+    comparisons; emit the same microsecond format instead.
+    """
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 class Task(Base):
     """
     ORM entity for a to-do item.
@@ -74,29 +181,224 @@ class Task(Base):
     - id (int, PK): unique identifier
     - title (str, ≤ 255 chars): task title (required)
     - is_done (bool): completion flag (default: False)
-    - created_at (datetime): UTC creation timestamp
+    - created_at (datetime): creation timestamp (set by the database)
+    - updated_at (datetime): last write timestamp (set by the database)
     """
 
     __tablename__ = "tasks"
     id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
     is_done = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+# Serve the status filter and newest-first ordering of the listing with one index scan
+Index(
+    "ix_tasks_is_done_created_at",
+    Task.is_done,
+    Task.created_at.desc(),
+    Task.id.desc(),
+)
+Index("ix_tasks_created_at", Task.created_at.desc(), Task.id.desc())
+
+# Page size bounds for GET /api/tasks
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Upper bound on titles per POST /api/tasks/bulk
+MAX_BULK_INSERT = 1000
+
+# Statements per status filter, built once at import instead of per request;
+# unknown statuses fall back to "all"
+_STATUS_CRITERIA = {
+    "all": (),
+    "active": (Task.is_done.is_(False),),
+    "completed": (Task.is_done.is_(True),),
+}
+_LIST_STMTS = {
+    # Plain columns: rows come back as lightweight tuples,
+    # no ORM instances or identity-map bookkeeping per row
+    status: select(Task.id, Task.title, Task.is_done, Task.created_at)
+    .where(*criteria)
+    # id breaks ties between rows created within the same clock tick
+    .order_by(Task.created_at.desc(), Task.id.desc())
+    for status, criteria in _STATUS_CRITERIA.items()
+}
+_ETAG_STMTS = {
+    status: select(
+        func.count(),
+        func.max(Task.updated_at),
+    ).where(*criteria)
+    for status, criteria in _STATUS_CRITERIA.items()
+}
+_DELETE_STMTS = {
+    status: delete(Task).where(*criteria)
+    for status, criteria in _STATUS_CRITERIA.items()
+}
 
 
 # Auto-create schema if it doesn't exist (safe for dev/local use)
 Base.metadata.create_all(bind=engine)
 
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _raiseload_in_debug(state):
+    """
+    In debug mode, forbid implicit lazy loads on ORM queries.
+
+    Accidental N+1 loads then fail at request time; handlers must load the
+    relationships they serialize explicitly (e.g. with selectinload).
+    """
+    if app.debug and state.is_select and not (
+        state.is_column_load or state.is_relationship_load
+    ):
+        state.statement = state.statement.options(raiseload("*"))
+
+
+def _tasks_etag(conn, status):
+    """
+    Compute an ETag for a task listing from one cheap aggregate query.
+
+    Every insert and update stamps the row's updated_at, which raises
+    max(updated_at) for the set the row is in; a row leaving the set
+    (delete, or toggle under a status filter) lowers count(*). The page
+    arguments of the current request are mixed in, so every page gets its
+    own tag.
+    """
+    agg = conn.execute(_ETAG_STMTS.get(status, _ETAG_STMTS["all"])).one()
+    key = f"{tuple(agg)}|{request.query_string.decode()}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# Task counters (Redis)
+# -----------------------------------------------------------------------------
+_COUNT_KEYS = ("tasks:active", "tasks:completed")
+# Bumped by every applied write; a seed computed before a write must not be stored
+_COUNTS_GEN_KEY = "tasks:counts:gen"
+# Writes between their commit-to-be and their delta, scored by start time
+_COUNTS_INFLIGHT_KEY = "tasks:counts:inflight"
+# In-flight entries older than this belong to crashed requests and are dropped
+_COUNTS_INFLIGHT_TIMEOUT = 30
+
+# Store freshly computed counts only if no write was in flight and none was
+# applied since the generation was read; otherwise the COUNT may or may not
+# include a write whose delta is applied separately
+_SEED_IF_UNCHANGED = redis_client.register_script("""
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", ARGV[5])
+if redis.call("ZCARD", KEYS[1]) == 0
+    and (redis.call("GET", KEYS[2]) or "0") == ARGV[1] then
+  redis.call("SET", KEYS[3], ARGV[2], "EX", ARGV[4])
+  redis.call("SET", KEYS[4], ARGV[3], "EX", ARGV[4])
+end
+""") if redis_client else None
+
+# Finish a write: clear its in-flight entry, bump the generation and apply the
+# deltas to counters that are seeded (a bare INCRBY on a missing key would
+# start it from 0), or drop both counters when the deltas are unknown
+_APPLY_COUNT_CHANGE = redis_client.register_script("""
+redis.call("ZREM", KEYS[1], ARGV[1])
+redis.call("INCR", KEYS[2])
+if ARGV[4] == "1" then
+  redis.call("DEL", KEYS[3], KEYS[4])
+  return
+end
+for i = 3, 4 do
+  if ARGV[i - 1] ~= "0" and redis.call("EXISTS", KEYS[i]) == 1 then
+    redis.call("INCRBY", KEYS[i], ARGV[i - 1])
+  end
+end
+""") if redis_client else None
+
+_COUNTS_STMT = select(
+    func.count(case((Task.is_done.is_(False), 1))),
+    func.count(case((Task.is_done.is_(True), 1))),
+)
+
+
+def _begin_count_change():
+    """
+    Register a write as in flight; call right before its commit.
+
+    Returns a token for _end_count_change, or None without Redis or on a
+    Redis error (the counters are then dropped instead of adjusted).
+    """
+    if redis_client is None:
+        return None
+    token = uuid.uuid4().hex
+    try:
+        redis_client.zadd(_COUNTS_INFLIGHT_KEY, {token: time.time()})
+    except redis.RedisError:
+        return None
+    return token
+
+
+def _end_count_change(token, active=0, completed=0, reset=False):
+    """
+    Apply a committed write's deltas to the cached counts.
+
+    With reset=True (or without a token) the counters are dropped and the
+    next stats read re-seeds them from the DB. Redis errors are swallowed:
+    the counts may then be stale for at most STATS_CACHE_TTL seconds.
+    """
+    if redis_client is None:
+        return
+    reset = reset or token is None
+    try:
+        _APPLY_COUNT_CHANGE(
+            keys=(_COUNTS_INFLIGHT_KEY, _COUNTS_GEN_KEY, *_COUNT_KEYS),
+            args=(token or "", active, completed, "1" if reset else "0"),
+        )
+    except redis.RedisError:
+        pass
+
+
+def _task_counts():
+    """
+    Return (active, completed), from Redis when seeded, otherwise from one
+    aggregate query (which then seeds Redis unless a write raced it).
+    """
+    gen = None
+    if redis_client is not None:
+        try:
+            cached = redis_client.mget(_COUNT_KEYS)
+            if None not in cached:
+                return int(cached[0]), int(cached[1])
+            gen = (redis_client.get(_COUNTS_GEN_KEY) or b"0").decode()
+        except redis.RedisError:
+            pass
+    with _readonly_engine.connect() as conn:
+        active, completed = conn.execute(_COUNTS_STMT).one()
+    if gen is not None:
+        try:
+            _SEED_IF_UNCHANGED(
+                keys=(_COUNTS_INFLIGHT_KEY, _COUNTS_GEN_KEY, *_COUNT_KEYS),
+                args=(
+                    gen, active, completed, STATS_CACHE_TTL,
+                    time.time() - _COUNTS_INFLIGHT_TIMEOUT,
+                ),
+            )
+        except redis.RedisError:
+            pass
+    return active, completed
+
+
 # -----------------------------------------------------------------------------
 # REST API Endpoints
 # -----------------------------------------------------------------------------
 @app.route("/api/tasks", methods=["GET"])
 def get_tasks():
     """
-    Get tasks with optional status filtering.
+    Get tasks with optional status filtering, newest first, one page at a time.
 
     Query params:
         status: "all" (default), "active", or "completed"
+        limit: page size (default 50, max 500)
+        before, before_id: keyset cursor (created_at ISO8601 and id of the
+            last task on the previous page); both or neither
 
     Returns:
         200 OK, JSON list of tasks:
@@ -104,30 +406,65 @@ def get_tasks():
             {"id": 1, "title": "...", "is_done": false, "created_at": "ISO8601"},
             ...
         ]
+        with a `Link: <...>; rel="next"` header when more tasks may follow,
+        and an `ETag` header on the first page (no cursor)
+        304 Not Modified if `If-None-Match` matches the first page's ETag
+        400 Bad Request if limit or the cursor is invalid
     """
     status = request.args.get("status", "all")
-    db = SessionLocal()
     try:
-        q = db.query(Task)
-        if status == "active":
-            q = q.filter(Task.is_done.is_(False))
-        elif status == "completed":
-            q = q.filter(Task.is_done.is_(True))
-        tasks = q.order_by(Task.created_at.desc()).all()
-        return jsonify([
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+        before = request.args.get("before")
+        before_id = request.args.get("before_id")
+        if (before is None) != (before_id is None):
+            raise ValueError
+        if before is not None:
+            before, before_id = datetime.fromisoformat(before), int(before_id)
+    except ValueError:
+        return jsonify({"error": "invalid limit or cursor"}), 400
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"}), 400
+
+    with _readonly_engine.connect() as conn:
+        # Pollers mostly re-fetch an unchanged first page: answer them from the
+        # aggregate. Deeper pages skip it, as it scans the whole filtered set.
+        etag = None
+        if before is None:
+            etag = _tasks_etag(conn, status)
+            if request.if_none_match.contains(etag):
+                resp = app.response_class(status=304)
+                resp.set_etag(etag)
+                return resp
+
+        stmt = _LIST_STMTS.get(status, _LIST_STMTS["all"])
+        if before is not None:
+            # Keyset pagination: an index range scan, no matter how deep the page
+            stmt = stmt.where(tuple_(Task.created_at, Task.id) < (before, before_id))
+        stmt = stmt.limit(limit)
+        rows = conn.execute(stmt).all()
+        resp = _json([
             {
-                "id": t.id,
-                "title": t.title,
-                "is_done": t.is_done,
-                "created_at": t.created_at.isoformat(),
-            } for t in tasks
+                "id": r[0],
+                "title": r[1],
+                "is_done": r[2],
+                "created_at": r[3],
+            } for r in rows
         ])
-    finally:
-        db.close()
+        if len(rows) == limit:
+            last = rows[-1]
+            next_url = url_for(
+                "get_tasks", status=status, limit=limit,
+                before=last[3].isoformat(), before_id=last[0],
+            )
+            resp.headers["Link"] = f'<{next_url}>; rel="next"'
+        if etag is not None:
+            resp.set_etag(etag)
+        return resp
 
 
 @app.route("/api/tasks", methods=["POST"])
-def add_task():
+@with_session
+def add_task(db):
     """
     Create a new task.
 
@@ -145,24 +482,83 @@ def add_task():
     title = (data.get("title") or "").strip()
     if not title:
         return jsonify({"error": "title required"}), 400
-    db = SessionLocal()
-    try:
-        task = Task(title=title)
-        db.add(task)
-        db.commit()
-        db.refresh(task)
-        return jsonify({
-            "id": task.id,
-            "title": task.title,
-            "is_done": task.is_done,
-            "created_at": task.created_at.isoformat(),
-        })
-    finally:
-        db.close()
+    # INSERT ... RETURNING hands back the DB-generated id and timestamp
+    cols = (Task.id, Task.title, Task.is_done, Task.created_at)
+    stmt = insert(Task).values(title=title)
+    if engine.dialect.insert_returning:
+        row = db.execute(stmt.returning(*cols)).first()
+    else:
+        # e.g. SQLite < 3.35 has no RETURNING
+        task_id = db.execute(stmt).inserted_primary_key[0]
+        row = db.execute(select(*cols).where(Task.id == task_id)).first()
+    token = _begin_count_change()
+    db.commit()
+    _end_count_change(token, active=1)
+    return _json({
+        "id": row[0],
+        "title": row[1],
+        "is_done": row[2],
+        "created_at": row[3],
+    })
+
+
+@app.route("/api/tasks/bulk", methods=["POST"])
+@with_session
+def add_tasks_bulk(db):
+    """
+    Create many tasks in one request.
+
+    Request JSON:
+        {"titles": ["Buy milk", "Walk the dog"]}
+
+    Validations:
+        - the body is a JSON object
+        - titles is a non-empty list of at most MAX_BULK_INSERT strings
+        - every title is trimmed, non-empty and fits the title column
+
+    Returns:
+        200 OK, JSON list of created tasks (in request order)
+        400 Bad Request if validation fails
+    """
+    data = request.json or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "request body must be a JSON object"}), 400
+    titles = data.get("titles")
+    if not isinstance(titles, list) or not 1 <= len(titles) <= MAX_BULK_INSERT:
+        return jsonify({"error": f"titles must be a list of 1 to {MAX_BULK_INSERT} items"}), 400
+    titles = [t.strip() if isinstance(t, str) else "" for t in titles]
+    if not all(titles):
+        return jsonify({"error": "title required"}), 400
+    # One oversized title would otherwise fail the whole batch in the DB
+    max_len = Task.title.type.length
+    if any(len(t) > max_len for t in titles):
+        return jsonify({"error": f"title must be at most {max_len} characters"}), 400
+    cols = (Task.id, Task.title, Task.is_done, Task.created_at)
+    params = [{"title": t} for t in titles]
+    if engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+        # "insertmanyvalues": batched into multi-row INSERT ... RETURNING
+        rows = db.execute(
+            insert(Task).returning(*cols, sort_by_parameter_order=True), params
+        ).all()
+    else:
+        ids = [db.execute(insert(Task).values(**p)).inserted_primary_key[0] for p in params]
+        rows = db.execute(select(*cols).where(Task.id.in_(ids)).order_by(Task.id)).all()
+    token = _begin_count_change()
+    db.commit()
+    _end_count_change(token, active=len(rows))
+    return _json([
+        {
+            "id": r[0],
+            "title": r[1],
+            "is_done": r[2],
+            "created_at": r[3],
+        } for r in rows
+    ])
 
 
 @app.route("/api/tasks/<int:task_id>/toggle", methods=["PATCH"])
-def toggle_task(task_id):
+@with_session
+def toggle_task(db, task_id):
     """
     Toggle completion status for a specific task.
 
@@ -173,26 +569,36 @@ def toggle_task(task_id):
         200 OK with updated task JSON
         404 Not Found if task does not exist
     """
-    db = SessionLocal()
-    try:
-        task = db.get(Task, task_id)
-        if not task:
-            return jsonify({"error": "not found"}), 404
-        task.is_done = not task.is_done
-        db.commit()
-        db.refresh(task)
-        return jsonify({
-            "id": task.id,
-            "title": task.title,
-            "is_done": task.is_done,
-            "created_at": task.created_at.isoformat(),
-        })
-    finally:
-        db.close()
+    # Flip the flag in the database and read the row back in one statement
+    cols = (Task.id, Task.title, Task.is_done, Task.created_at)
+    stmt = update(Task).where(Task.id == task_id).values(is_done=~Task.is_done)
+    if engine.dialect.update_returning:
+        row = db.execute(stmt.returning(*cols)).first()
+    else:
+        # e.g. SQLite < 3.35 has no RETURNING
+        row = None
+        if db.execute(stmt).rowcount > 0:
+            row = db.execute(select(*cols).where(Task.id == task_id)).first()
+    token = _begin_count_change() if row is not None else None
+    db.commit()
+    if row is None:
+        return jsonify({"error": "not found"}), 404
+    # The task moved from one bucket to the other
+    if row[2]:
+        _end_count_change(token, active=-1, completed=1)
+    else:
+        _end_count_change(token, active=1, completed=-1)
+    return _json({
+        "id": row[0],
+        "title": row[1],
+        "is_done": row[2],
+        "created_at": row[3],
+    })
 
 
 @app.route("/api/tasks/<int:task_id>", methods=["DELETE"])
-def delete_task(task_id):
+@with_session
+def delete_task(db, task_id):
     """
     Delete a task by ID.
 
@@ -203,20 +609,32 @@ def delete_task(task_id):
         204 No Content on success
         404 Not Found if task does not exist
     """
-    db = SessionLocal()
-    try:
-        task = db.get(Task, task_id)
-        if not task:
-            return jsonify({"error": "not found"}), 404
-        db.delete(task)
-        db.commit()
-        return ("", 204)
-    finally:
-        db.close()
+    # Single DELETE statement instead of SELECT + DELETE
+    stmt = delete(Task).where(Task.id == task_id)
+    if engine.dialect.delete_returning:
+        row = db.execute(stmt.returning(Task.is_done)).first()
+        found = row is not None
+    else:
+        # e.g. SQLite < 3.35 has no RETURNING
+        row = None
+        found = db.execute(stmt).rowcount > 0
+    token = _begin_count_change() if found else None
+    db.commit()
+    if not found:
+        return jsonify({"error": "not found"}), 404
+    if row is None:
+        # Unknown bucket without RETURNING
+        _end_count_change(token, reset=True)
+    elif row[0]:
+        _end_count_change(token, completed=-1)
+    else:
+        _end_count_change(token, active=-1)
+    return ("", 204)
 
 
 @app.route("/api/tasks", methods=["DELETE"])
-def bulk_delete():
+@with_session
+def bulk_delete(db):
     """
     Bulk delete tasks by status.
 
@@ -227,18 +645,37 @@ def bulk_delete():
         200 OK, {"deleted": <int>}
     """
     status = request.args.get("status", "all")
-    db = SessionLocal()
-    try:
-        q = db.query(Task)
-        if status == "active":
-            q = q.filter(Task.is_done.is_(False))
-        elif status == "completed":
-            q = q.filter(Task.is_done.is_(True))
-        deleted = q.delete(synchronize_session=False)
-        db.commit()
-        return jsonify({"deleted": deleted})
-    finally:
-        db.close()
+    deleted = db.execute(
+        _DELETE_STMTS.get(status, _DELETE_STMTS["all"]),
+        execution_options={"synchronize_session": False},
+    ).rowcount
+    token = _begin_count_change() if deleted else None
+    db.commit()
+    if not deleted:
+        pass
+    elif status == "active":
+        _end_count_change(token, active=-deleted)
+    elif status == "completed":
+        _end_count_change(token, completed=-deleted)
+    else:
+        # Unfiltered delete: the split between buckets is unknown
+        _end_count_change(token, reset=True)
+    return jsonify({"deleted": deleted})
+
+
+@app.route("/api/tasks/stats", methods=["GET"])
+def task_stats():
+    """
+    Get the number of active and completed tasks.
+
+    Served from Redis when REDIS_URL is set (seeded from the DB on a miss),
+    otherwise from a single aggregate query.
+
+    Returns:
+        200 OK, {"active": <int>, "completed": <int>}
+    """
+    active, completed = _task_counts()
+    return jsonify({"active": active, "completed": completed})
 
 # -----------------------------------------------------------------------------
 # Health check & UI
@@ -253,7 +690,7 @@ def health():
         500 {"status": "db_error"} if DB query fails
     """
     try:
-        with engine.connect() as conn:
+        with _readonly_engine.connect() as conn:
             conn.execute(text("SELECT 1"))
         return {"status": "ok"}, 200
     except SQLAlchemyError as e:
@@ -272,5 +709,6 @@ def index():
 # Entrypoint
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
+    # Werkzeug dev server (local use only); production runs gunicorn via wsgi.py
     port = int(os.getenv("PORT", "5000"))
-    app.run(host="0.0.0.0", port=port, debug=True)
+    app.run(host="0.0.0.0", port=port, debug=os.getenv("FLASK_ENV") == "development")
@@ -16,14 +16,19 @@ Environment Variables:
 
 import os
 import json
+from functools import lru_cache
 from urllib.parse import quote_plus
 
+@lru_cache(maxsize=None)
 def _maybe_from_json(val: str, key: str) -> str:
     """
     If val looks like JSON -> return obj[key] if present, else original val.
     """
     if not val:
         return val
+    # Fast path: plain values need neither stripping nor JSON parsing
+    if val[0] != "{" and not val[0].isspace() and not val[-1].isspace():
+        return val
     val = val.strip()
     if val.startswith("{") and val.endswith("}"):
         try:
@@ -34,25 +39,30 @@ def _maybe_from_json(val: str, key: str) -> str:
             pass
     return val
 
-# Raw envs
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT", "5432")
-DB_NAME = os.getenv("DB_NAME")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD", "")
-
-# If secrets came as JSON (RDS credentials), extract needed fields
-# e.g. {"username":"todo_admin","password":"..."}
-DB_USER = _maybe_from_json(DB_USER, "username") or DB_USER
-DB_PASSWORD = _maybe_from_json(DB_PASSWORD, "password") or DB_PASSWORD
-
-# Quote password for special characters
-DB_PASSWORD_Q = quote_plus(DB_PASSWORD) if DB_PASSWORD is not None else ""
-
-# Build URI (Postgres preferred) or fallback to SQLite locally
-if DB_HOST and DB_NAME and (DB_USER is not None):
-    SQLALCHEMY_DATABASE_URI = (
-        f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD_Q}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-    )
-else:
-    SQLALCHEMY_DATABASE_URI = "sqlite:///todo.db"
+@lru_cache(maxsize=None)
+def get_uri() -> str:
+    """
+    Build the SQLAlchemy URI from environment variables (computed once per process).
+    """
+    # Raw envs
+    db_host = os.getenv("DB_HOST")
+    db_port = os.getenv("DB_PORT", "5432")
+    db_name = os.getenv("DB_NAME")
+    db_user = os.getenv("DB_USER")
+    db_password = os.getenv("DB_PASSWORD", "")
+
+    # If secrets came as JSON (RDS credentials), extract needed fields
+    # e.g. {"username":"todo_admin","password":"..."}
+    db_user = _maybe_from_json(db_user, "username") or db_user
+    db_password = _maybe_from_json(db_password, "password") or db_password
+
+    # Quote password for special characters
+    db_password_q = quote_plus(db_password) if db_password is not None else ""
+
+    # Build URI (Postgres preferred) or fallback to SQLite locally
+    if db_host and db_name and (db_user is not None):
+        return f"postgresql+psycopg://{db_user}:{db_password_q}@{db_host}:{db_port}/{db_name}"
+    return "sqlite:///todo.db"
+
+
+SQLALCHEMY_DATABASE_URI = get_uri()
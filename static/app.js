@@ -38,12 +38,20 @@ function toast(msg, type = "info") {
 // -----------------------------------------------------------------------------
 // Load tasks from API and render into <ul id="tasks">
 // -----------------------------------------------------------------------------
-async function loadTasks() {
-  const res = await fetch(`/api/tasks?status=${currentStatus}`);
+
+// URL of the next page (from the Link rel="next" header), or null on the last page
+let nextPageUrl = null;
+
+// Fetch one page of tasks; append to the list, or replace it when append=false
+async function fetchTasksPage(url, append) {
+  const res = await fetch(url);
   const tasks = await res.json();
+  const next = (res.headers.get("Link") || "").match(/<([^>]+)>;\s*rel="next"/);
+  nextPageUrl = next ? next[1] : null;
+  document.getElementById("load-more").hidden = !nextPageUrl;
 
   const list = document.getElementById("tasks");
-  list.innerHTML = ""; // clear previous
+  if (!append) list.innerHTML = ""; // clear previous
 
   tasks.forEach((t) => {
     const li = document.createElement("li");
@@ -63,6 +71,15 @@ async function loadTasks() {
   });
 }
 
+// (Re)load the first page; further pages are fetched on demand via "Load more"
+async function loadTasks() {
+  await fetchTasksPage(`/api/tasks?status=${currentStatus}`, false);
+}
+
+async function loadMoreTasks() {
+  if (nextPageUrl) await fetchTasksPage(nextPageUrl, true);
+}
+
 // -----------------------------------------------------------------------------
 // Small helper: escape HTML to prevent XSS in task titles
 // -----------------------------------------------------------------------------
@@ -173,6 +190,9 @@ document.querySelectorAll(".filter-btn").forEach((btn) => {
   });
 });
 
+// Next page of tasks
+document.getElementById("load-more").addEventListener("click", loadMoreTasks);
+
 // Bulk clear buttons
 document.getElementById("clear-all").addEventListener("click", () => {
   if (confirm("Delete ALL tasks?")) clearAll("all");
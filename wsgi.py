@@ -0,0 +1,17 @@
+"""
+wsgi.py — Production entrypoint for gunicorn with gevent workers.
+
+Monkey-patching must happen before anything else imports sockets or the
+database driver, so this module patches first and only then imports the app.
+
+Usage:
+    gunicorn -k gevent --worker-connections 1000 -w $(nproc) -b 0.0.0.0:5000 wsgi:app
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+# psycopg 3 waits on sockets through the (now patched) stdlib, so database
+# calls yield to other greenlets without an extra wait callback
+from app import app  # noqa: E402,F401